@@ -5,121 +5,190 @@ Quick check to see what secrets are available in GitHub Actions
 """
 
 import os
+import sys
+from collections import namedtuple
+
+_ENV_KEYS = (
+    'GITHUB_ACTIONS', 'EMAIL_PROVIDER', 'RESEND_API_KEY',
+    'EMAIL_USER', 'EMAIL_PASSWORD', 'SMTP_SERVER', 'SMTP_PORT',
+    'REDDIT_CLIENT_ID', 'REDDIT_CLIENT_SECRET', 'REDDIT_USER_AGENT'
+)
+
+_VALID_PROVIDERS = frozenset(('google', 'resend'))
+
+# Masked secrets are reported as present but their values are never echoed
+SecretSpec = namedtuple('SecretSpec', 'name masked')
+
+_SMTP_SCHEMA = (
+    SecretSpec('EMAIL_USER', False),
+    SecretSpec('EMAIL_PASSWORD', True),
+    SecretSpec('SMTP_SERVER', False),
+    SecretSpec('SMTP_PORT', False)
+)
+_REDDIT_SCHEMA = (
+    SecretSpec('REDDIT_CLIENT_ID', False),
+    SecretSpec('REDDIT_CLIENT_SECRET', True),
+    SecretSpec('REDDIT_USER_AGENT', False)
+)
+
+# Secrets the provider EmailService sends through first cannot work without
+_REQUIRED_BY_ROUTE = {
+    'smtp': ('EMAIL_USER', 'EMAIL_PASSWORD'),
+    'resend': ('RESEND_API_KEY',)
+}
+_ROUTE_LABELS = {'smtp': 'SMTP', 'resend': 'Resend'}
+
+# Status line templates used by _report()
+_TPL_FOUND = "✅ {}: {}"
+_TPL_FOUND_MASKED = "✅ {}: Found (***)"
+_TPL_MISSING = "❌ {}: Not found"
+
+def _present(value):
+    """True if value is set and not just whitespace"""
+    return bool(value) and not value.isspace()
+
+def _report(schema, env, out):
+    """Append one status line per secret in schema, return True if any is set"""
+    any_present = False
+    for secret_name, masked in schema:
+        secret_value = env[secret_name]
+        if _present(secret_value):
+            if masked:
+                out.append(_TPL_FOUND_MASKED.format(secret_name))
+            else:
+                out.append(_TPL_FOUND.format(secret_name, secret_value))
+            any_present = True
+        else:
+            out.append(_TPL_MISSING.format(secret_name))
+    return any_present
+
+def _primary_route(email_provider, has_resend):
+    """Provider EmailService tries first: SMTP for 'google', otherwise Resend if a key is set, else SMTP"""
+    if email_provider != 'google' and has_resend:
+        return 'resend'
+    return 'smtp'
+
+def _read_env():
+    """Read every variable once up front"""
+    return {key: os.environ.get(key, '') for key in _ENV_KEYS}
+
+def check_secrets_quiet():
+    """Exit-code-only check: silent when the provider mail will go through first is configured"""
+    env = _read_env()
+    email_provider = env['EMAIL_PROVIDER'].lower()
+    route = _primary_route(email_provider, _present(env['RESEND_API_KEY']))
+    
+    missing = [name for name in _REQUIRED_BY_ROUTE[route] if not _present(env[name])]
+    if missing:
+        hint = " (or set RESEND_API_KEY)" if email_provider != 'google' else ''
+        sys.stdout.write(f"Missing secrets for {_ROUTE_LABELS[route]}: {', '.join(missing)}{hint}\n")
+        return 1
+    return 0
 
 def check_secrets():
     """Check GitHub Actions environment for secrets"""
-    print("🔍 GitHub Actions Secrets Check")
-    print("===============================")
+    env = _read_env()
+    
+    # Collect output and write it in one go at the end
+    out = []
+    
+    out.append("🔍 GitHub Actions Secrets Check")
+    out.append("===============================")
     
     # Check if running in GitHub Actions
-    is_github_actions = os.getenv('GITHUB_ACTIONS') == 'true'
-    print(f"Environment: {'🤖 GitHub Actions' if is_github_actions else '💻 Local Development'}")
-    print()
+    is_github_actions = env['GITHUB_ACTIONS'] == 'true'
+    out.append(f"Environment: {'🤖 GitHub Actions' if is_github_actions else '💻 Local Development'}")
+    out.append('')
+    
+    # Presence is decided once so the report agrees with check_secrets_quiet()
+    resend_key = env['RESEND_API_KEY']
+    has_resend = _present(resend_key)
+    has_user = _present(env['EMAIL_USER'])
+    has_password = _present(env['EMAIL_PASSWORD'])
+    smtp_configured = has_user and has_password
     
     # Check email provider selection
-    email_provider = os.getenv('EMAIL_PROVIDER', 'google').lower()
-    print(f"🔧 Email Provider Selection:")
-    print(f"   📧 EMAIL_PROVIDER: {email_provider}")
+    email_provider = env['EMAIL_PROVIDER'].lower()
+    out.append(f"🔧 Email Provider Selection:")
+    out.append(f"   📧 EMAIL_PROVIDER: {email_provider or '(not set)'}")
     
-    if email_provider not in ['google', 'resend']:
-        print(f"   ⚠️ Warning: Unknown provider '{email_provider}'. Using 'google' as default.")
-        email_provider = 'google'
+    if email_provider and email_provider not in _VALID_PROVIDERS:
+        out.append(f"   ⚠️ Warning: Unknown provider '{email_provider}'. Using Resend if RESEND_API_KEY is set, otherwise SMTP.")
+    elif not email_provider:
+        out.append("   ℹ️ Not set: using Resend if RESEND_API_KEY is set, otherwise SMTP.")
     
-    print()
+    out.append('')
     
     # Check for Resend API Key
-    resend_key = os.getenv('RESEND_API_KEY')
-    if resend_key:
+    if has_resend:
         # Don't print the actual key, just show it exists
-        masked_key = resend_key[:8] + '...' + resend_key[-4:] if len(resend_key) > 12 else '***'
-        print(f"✅ RESEND_API_KEY: Found ({masked_key})")
+        masked_key = f"{resend_key[:8]}...{resend_key[-4:]}" if len(resend_key) > 12 else '***'
+        out.append(f"✅ RESEND_API_KEY: Found ({masked_key})")
     else:
-        print(f"❌ RESEND_API_KEY: Not found")
-        print(f"   💡 Add this secret in GitHub: Settings → Secrets → Actions")
-        print(f"   🔗 Get free API key: https://resend.com")
+        out.append(f"❌ RESEND_API_KEY: Not found")
+        out.append(f"   💡 Add this secret in GitHub: Settings → Secrets → Actions")
+        out.append(f"   🔗 Get free API key: https://resend.com")
     
-    print()
+    out.append('')
     
     # Check SMTP fallback secrets
-    smtp_secrets = {
-        'EMAIL_USER': os.getenv('EMAIL_USER'),
-        'EMAIL_PASSWORD': os.getenv('EMAIL_PASSWORD'), 
-        'SMTP_SERVER': os.getenv('SMTP_SERVER'),
-        'SMTP_PORT': os.getenv('SMTP_PORT')
-    }
-    
-    print("📧 SMTP Fallback Configuration:")
-    for secret_name, secret_value in smtp_secrets.items():
-        if secret_value and secret_value.strip():
-            if 'PASSWORD' in secret_name:
-                print(f"✅ {secret_name}: Found (***)")
-            else:
-                print(f"✅ {secret_name}: {secret_value}")
-        else:
-            print(f"❌ {secret_name}: Not found")
+    out.append("📧 SMTP Fallback Configuration:")
+    _report(_SMTP_SCHEMA, env, out)
     
-    print()
+    out.append('')
     
     # Check Reddit API secrets
-    reddit_secrets = {
-        'REDDIT_CLIENT_ID': os.getenv('REDDIT_CLIENT_ID'),
-        'REDDIT_CLIENT_SECRET': os.getenv('REDDIT_CLIENT_SECRET'),
-        'REDDIT_USER_AGENT': os.getenv('REDDIT_USER_AGENT')
-    }
-    
-    print("🤖 Reddit API Configuration:")
-    reddit_configured = False
-    for secret_name, secret_value in reddit_secrets.items():
-        if secret_value and secret_value.strip():
-            if 'SECRET' in secret_name:
-                print(f"✅ {secret_name}: Found (***)")
-            else:
-                print(f"✅ {secret_name}: {secret_value}")
-            reddit_configured = True
-        else:
-            print(f"❌ {secret_name}: Not found")
+    out.append("🤖 Reddit API Configuration:")
+    reddit_configured = _report(_REDDIT_SCHEMA, env, out)
     
     if not reddit_configured:
-        print("💡 Reddit API not configured - will use RSS feeds (still works!)")
-        print("🔗 Optional setup: https://www.reddit.com/prefs/apps")
+        out.append("💡 Reddit API not configured - will use RSS feeds (still works!)")
+        out.append("🔗 Optional setup: https://www.reddit.com/prefs/apps")
     
-    print()
+    out.append('')
     
-    # Recommendations
+    # Recommendations, following the order EmailService tries providers in
     if email_provider == 'google':
-        if any([smtp_secrets['EMAIL_USER'], smtp_secrets['EMAIL_PASSWORD']]):
-            missing_smtp = [k for k, v in smtp_secrets.items() if not v or not v.strip()]
+        if has_user or has_password:
+            missing_smtp = [spec.name for spec in _SMTP_SCHEMA if not _present(env[spec.name])]
             if missing_smtp:
-                print(f"⚠️  Google (SMTP) partially configured. Missing: {', '.join(missing_smtp)}")
+                out.append(f"⚠️  Google (SMTP) partially configured. Missing: {', '.join(missing_smtp)}")
             else:
-                print("✅ Google (SMTP) fully configured! Primary email provider ready.")
-                if resend_key:
-                    print("✅ Resend also configured as fallback.")
+                out.append("✅ Google (SMTP) fully configured! Primary email provider ready.")
+                if has_resend:
+                    out.append("✅ Resend also configured as fallback.")
         else:
-            print("❌ Google selected but SMTP not configured!")
-            print("   🎯 Add EMAIL_USER + EMAIL_PASSWORD secrets for Gmail")
-            if resend_key:
-                print("   ✅ Resend available as fallback")
+            out.append("❌ Google selected but SMTP not configured!")
+            out.append("   🎯 Add EMAIL_USER + EMAIL_PASSWORD secrets for Gmail")
+            if has_resend:
+                out.append("   ✅ Resend available as fallback")
             else:
-                print("   🔧 Or add RESEND_API_KEY as fallback")
+                out.append("   🔧 Or add RESEND_API_KEY as fallback")
                 
+    elif has_resend:
+        out.append("✅ Resend API configured! Primary email provider ready.")
+        if smtp_configured:
+            out.append("✅ SMTP also configured as fallback.")
     elif email_provider == 'resend':
-        if resend_key:
-            print("✅ Resend API configured! Primary email provider ready.")
-            smtp_configured = all([smtp_secrets['EMAIL_USER'], smtp_secrets['EMAIL_PASSWORD']])
-            if smtp_configured:
-                print("✅ SMTP also configured as fallback.")
+        out.append("❌ Resend selected but API key not configured!")
+        out.append("   🎯 Add RESEND_API_KEY secret")
+        if smtp_configured:
+            out.append("   ✅ SMTP available as fallback")
         else:
-            print("❌ Resend selected but API key not configured!")
-            print("   🎯 Add RESEND_API_KEY secret")
-            smtp_configured = all([smtp_secrets['EMAIL_USER'], smtp_secrets['EMAIL_PASSWORD']])
-            if smtp_configured:
-                print("   ✅ SMTP available as fallback")
-            else:
-                print("   🔧 Or add EMAIL_USER + EMAIL_PASSWORD as fallback")
+            out.append("   🔧 Or add EMAIL_USER + EMAIL_PASSWORD as fallback")
+    elif smtp_configured:
+        out.append("✅ SMTP configured! Primary email provider ready.")
+    else:
+        out.append("❌ No email provider configured!")
+        out.append("   🎯 Add RESEND_API_KEY, or EMAIL_USER + EMAIL_PASSWORD for SMTP")
+    
+    out.append('')
+    out.append("🚀 Next: Run the workflow to test email delivery!")
     
-    print()
-    print("🚀 Next: Run the workflow to test email delivery!")
+    sys.stdout.write('\n'.join(out) + '\n')
 
 if __name__ == "__main__":
-    check_secrets() 
\ No newline at end of file
+    # --quiet (or CHECK_SECRETS_QUIET=1) skips the report and only sets the exit code
+    if '--quiet' in sys.argv[1:] or os.environ.get('CHECK_SECRETS_QUIET') == '1':
+        sys.exit(check_secrets_quiet())
+    check_secrets()
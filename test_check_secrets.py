@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests for check_secrets.py: the quiet exit code and the full report must
+agree with how EmailService routes mail
+"""
+
+import io
+import os
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+import check_secrets
+
+# Every variable check_secrets reads, unset the way the workflow passes missing secrets
+EMPTY_ENV = {key: '' for key in check_secrets._ENV_KEYS}
+
+def run_check(func, **secrets):
+    """Run func with only the given secrets set, return (result, printed output)"""
+    out = io.StringIO()
+    with mock.patch.dict(os.environ, {**EMPTY_ENV, **secrets}), redirect_stdout(out):
+        result = func()
+    return result, out.getvalue()
+
+class QuietModeTest(unittest.TestCase):
+    def test_empty_provider_with_only_resend_key_passes(self):
+        code, output = run_check(check_secrets.check_secrets_quiet, RESEND_API_KEY='re_1234567890abcdef')
+        self.assertEqual(code, 0)
+        self.assertEqual(output, '')
+
+    def test_unknown_provider_with_only_resend_key_passes(self):
+        code, _ = run_check(check_secrets.check_secrets_quiet,
+                            EMAIL_PROVIDER='mailgun', RESEND_API_KEY='re_1234567890abcdef')
+        self.assertEqual(code, 0)
+
+    def test_empty_provider_without_resend_needs_smtp(self):
+        code, output = run_check(check_secrets.check_secrets_quiet, EMAIL_USER='me@example.com')
+        self.assertEqual(code, 1)
+        self.assertIn('EMAIL_PASSWORD', output)
+
+    def test_google_needs_smtp_even_with_resend_key(self):
+        code, output = run_check(check_secrets.check_secrets_quiet,
+                                 EMAIL_PROVIDER='google', RESEND_API_KEY='re_1234567890abcdef')
+        self.assertEqual(code, 1)
+        self.assertIn('EMAIL_USER', output)
+
+    def test_blank_resend_key_is_missing(self):
+        code, _ = run_check(check_secrets.check_secrets_quiet, EMAIL_PROVIDER='resend', RESEND_API_KEY=' ')
+        self.assertEqual(code, 1)
+
+class ReportTest(unittest.TestCase):
+    def test_blank_resend_key_is_reported_missing(self):
+        _, output = run_check(check_secrets.check_secrets, EMAIL_PROVIDER='resend', RESEND_API_KEY=' ')
+        self.assertIn('❌ RESEND_API_KEY: Not found', output)
+        self.assertIn('❌ Resend selected but API key not configured!', output)
+        self.assertNotIn('Primary email provider ready', output)
+
+    def test_empty_provider_with_only_resend_key_is_ready(self):
+        _, output = run_check(check_secrets.check_secrets, RESEND_API_KEY='re_1234567890abcdef')
+        self.assertIn('✅ Resend API configured! Primary email provider ready.', output)
+
+if __name__ == "__main__":
+    unittest.main()